@@ -1,11 +1,16 @@
-import json
+import codecs
 import re
+import warnings
+from collections import deque
+from datetime import timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+import orjson
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
 from dotenv import load_dotenv
 import os
 
@@ -28,34 +33,46 @@ ALBUM_SLUG = "dont_be_dumb"
 
 GENIUS_API_BASE = "https://api.genius.com"
 
+# One keep-alive session for every request (reuses TCP/TLS connections).
+# GET responses are cached on disk for a week so re-runs skip the network.
+HTTP_CACHE = DATA_DIR / "http_cache.sqlite"
+SESSION = CachedSession(str(HTTP_CACHE), expire_after=timedelta(days=7), allowable_methods=("GET",))
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 
 # -----------------------------
 # Helpers: cleaning & IDs
 # -----------------------------
+_RE_WS = re.compile(r"\s+")
+# (feat. ...) / [Official Audio] style bracketed noise
+_RE_BRACKET_NOISE = re.compile(
+    r"[\(\[][^\)\]]*"
+    r"(?:feat\.|ft\.|featuring|official\s+audio|official\s+video|audio|video|explicit|clean|lyrics?)"
+    r"[^\)\]]*[\)\]]",
+    re.IGNORECASE,
+)
+# trailing "- Official Audio" style suffix, then a trailing "Lyrics 123.4K" left before it;
+# kept as two patterns since both suffixes can appear on the same title
+_RE_TRAILING_SUFFIX = re.compile(
+    r"\s*-\s*(?:official\s+audio|official\s+video|audio|video|lyrics?)\s*$",
+    re.IGNORECASE,
+)
+_RE_TRAILING_LYRICS_COUNT = re.compile(r"\s*lyrics\s*\d+(?:\.\d+)?k\s*$", re.IGNORECASE)
+_RE_PRELOADED_STATE = re.compile(r"window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\(\"(.+?)\"\);")
+_RE_TRACK_ROW = re.compile(r"^(\d+)\.?\s+(.*)$")
+
+
 def clean_track_name(name: str) -> str:
     if name is None:
         return ""
-    s = str(name).strip()
-    s = re.sub(r"\s+", " ", s)
-
-    # Remove (feat...) / [feat...]
-    s = re.sub(r"[\(\[].*?(feat\.|ft\.|featuring).*?[\)\]]", "", s, flags=re.IGNORECASE)
-
-    # Remove common noise in brackets
-    s = re.sub(
-        r"[\(\[].*?(official audio|official video|audio|video|explicit|clean|lyric[s]?).*?[\)\]]",
-        "",
-        s,
-        flags=re.IGNORECASE,
-    )
-
-    # Remove trailing "- Official Audio" style suffix
-    s = re.sub(r"\s*-\s*(official audio|official video|audio|video|lyrics?)\s*$", "", s, flags=re.IGNORECASE)
 
-    # Remove trailing "Lyrics 123.4K" or "Lyrics 12K"
-    s = re.sub(r"\s*lyrics\s*\d+(\.\d+)?k\s*$", "", s, flags=re.IGNORECASE)
+    # Remove (feat...) / [Official Audio] etc. in one pass, then any trailing
+    # "- Official Audio" suffix and "Lyrics 12K" left behind, in that order
+    s = _RE_BRACKET_NOISE.sub("", str(name))
+    s = _RE_TRAILING_SUFFIX.sub("", s)
+    s = _RE_TRAILING_LYRICS_COUNT.sub("", s)
 
-    return re.sub(r"\s+", " ", s).strip()
+    return _RE_WS.sub(" ", s).strip()
 
 
 def make_track_id(album_slug: str, track_number: int) -> str:
@@ -63,37 +80,41 @@ def make_track_id(album_slug: str, track_number: int) -> str:
 
 
 def normalize(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip().lower()
+    return _RE_WS.sub(" ", s or "").strip().lower()
 
 
 # -----------------------------
 # Genius API calls
 # -----------------------------
+def _get_json(url: str, **kwargs) -> dict:
+    r = SESSION.get(url, **kwargs)
+    r.raise_for_status()
+    return orjson.loads(r.content)
+
+
 def genius_headers(token: str) -> Dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
 def genius_search(token: str, q: str, per_page: int = 10) -> List[dict]:
-    r = requests.get(
+    data = _get_json(
         f"{GENIUS_API_BASE}/search",
         headers=genius_headers(token),
         params={"q": q},
         timeout=30,
     )
-    r.raise_for_status()
-    hits = r.json().get("response", {}).get("hits", [])
+    hits = data.get("response", {}).get("hits", [])
     return hits[:per_page]
 
 
 def genius_song(token: str, song_id: int) -> dict:
-    r = requests.get(
+    data = _get_json(
         f"{GENIUS_API_BASE}/songs/{song_id}",
         headers=genius_headers(token),
         params={"text_format": "plain"},
         timeout=30,
     )
-    r.raise_for_status()
-    return r.json().get("response", {}).get("song", {})
+    return data.get("response", {}).get("song", {})
 
 
 def pick_candidate_song_id(token: str, album_name: str, artist_name: str) -> Optional[int]:
@@ -104,23 +125,24 @@ def pick_candidate_song_id(token: str, album_name: str, artist_name: str) -> Opt
     query = f"{album_name} {artist_name}"
     hits = genius_search(token, query, per_page=15)
 
-    # Prefer hits where the primary artist matches
+    # Prefer hits where the primary artist matches: the first such hit wins outright,
+    # so stop scanning as soon as one is found. Otherwise fall back to the first hit
+    # with an id, remembered on the same pass.
     artist_norm = normalize(artist_name)
+    fallback_id: Optional[int] = None
     for h in hits:
         result = h.get("result", {})
+        song_id = result.get("id")
+        if not song_id:
+            continue
+        if fallback_id is None:
+            fallback_id = int(song_id)
+
         primary_artist = normalize(result.get("primary_artist", {}).get("name", ""))
         if artist_norm in primary_artist or primary_artist in artist_norm:
-            song_id = result.get("id")
-            if song_id:
-                return int(song_id)
-
-    # Fallback: first hit with an id
-    for h in hits:
-        song_id = h.get("result", {}).get("id")
-        if song_id:
             return int(song_id)
 
-    return None
+    return fallback_id
 
 
 # -----------------------------
@@ -132,23 +154,39 @@ def extract_preloaded_state_json(html: str) -> Optional[dict]:
     This function tries to locate and decode it.
     """
     # Common pattern: window.__PRELOADED_STATE__ = JSON.parse("...escaped json...");
-    m = re.search(r"window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\(\"(.+?)\"\);", html)
+    m = _RE_PRELOADED_STATE.search(html)
     if not m:
         return None
 
-    raw = m.group(1)
+    raw = m.group(1).encode("utf-8")
 
     # Unescape the JSON string content
     # It contains escaped quotes and unicode sequences.
+    # escape_decode handles the JS escapes in C and leaves \uXXXX for the JSON parser;
+    # it warns about those (and \/) as invalid bytes escapes, which is expected here.
     try:
-        unescaped = raw.encode("utf-8").decode("unicode_escape")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            unescaped, _ = codecs.escape_decode(raw)
         # Fix escaped slashes
-        unescaped = unescaped.replace(r"\/", "/")
-        return json.loads(unescaped)
+        unescaped = unescaped.replace(b"\\/", b"/")
+        return orjson.loads(unescaped)
     except Exception:
         return None
 
 
+# Preloaded-state keys whose subtrees are unrelated to the tracklist (and can be large)
+STATE_SKIP_KEYS = frozenset({
+    "user",
+    "session",
+    "ads",
+    "related_songs",
+    "comments",
+    "translations",
+    "annotations",
+})
+
+
 def find_tracks_in_state(state: dict, expected_album_name: str) -> Optional[List[Tuple[int, str]]]:
     """
     The structure can vary. We try to locate album/tracklist information in the preloaded state.
@@ -157,42 +195,37 @@ def find_tracks_in_state(state: dict, expected_album_name: str) -> Optional[List
     # Heuristic: search for any dicts containing "tracklist" or track-like objects.
     # We'll do a broad walk and collect anything that looks like track entries.
     expected = normalize(expected_album_name)
-    candidates: List[Tuple[int, str]] = []
 
-    def walk(x):
+    # Deduplicate and sanity filter as we go: track numbers should be positive and
+    # not insane, and the first title seen for a number wins
+    cleaned: Dict[int, str] = {}
+
+    def add_candidate(tn, title):
+        if isinstance(tn, int) and isinstance(title, str) and 1 <= tn <= 50:
+            cleaned.setdefault(tn, title)
+
+    # Iterative pre-order walk (same visiting order as a recursive one, but no
+    # per-level call overhead and no recursion limit on deeply nested states)
+    stack = deque([state])
+    while stack and len(cleaned) < 50:
+        x = stack.pop()
         if isinstance(x, dict):
             # Some states include album objects with name/title and tracklist items
             # We'll look for patterns:
             # - keys like "tracks", "tracklist", "track_number", "number"
             # - nested objects with "title" / "name"
             if "track_number" in x and ("title" in x or "name" in x):
-                tn = x.get("track_number")
-                title = x.get("title") or x.get("name")
-                if isinstance(tn, int) and isinstance(title, str):
-                    candidates.append((tn, title))
+                add_candidate(x.get("track_number"), x.get("title") or x.get("name"))
 
             if "number" in x and ("title" in x or "name" in x):
-                tn = x.get("number")
-                title = x.get("title") or x.get("name")
-                if isinstance(tn, int) and isinstance(title, str):
-                    candidates.append((tn, title))
+                add_candidate(x.get("number"), x.get("title") or x.get("name"))
 
-            # Walk children
-            for v in x.values():
-                walk(v)
+            # Walk children (pushed reversed so they pop in document order),
+            # skipping subtrees that never hold the album tracklist
+            stack.extend(v for k, v in reversed(x.items()) if k not in STATE_SKIP_KEYS)
 
         elif isinstance(x, list):
-            for v in x:
-                walk(v)
-
-    walk(state)
-
-    # Deduplicate and sanity filter: track numbers should be positive and not insane
-    cleaned = {}
-    for tn, title in candidates:
-        if 1 <= tn <= 50:
-            # keep first seen
-            cleaned.setdefault(tn, title)
+            stack.extend(reversed(x))
 
     if not cleaned:
         return None
@@ -207,7 +240,7 @@ def scrape_album_tracklist(album_url: str, expected_album_name: str) -> List[Tup
     Primary method: parse preloaded state JSON.
     Fallback: parse visible HTML tracklist rows (less reliable).
     """
-    r = requests.get(album_url, timeout=30)
+    r = SESSION.get(album_url, timeout=30)
     r.raise_for_status()
     html = r.text
 
@@ -219,7 +252,7 @@ def scrape_album_tracklist(album_url: str, expected_album_name: str) -> List[Tup
             return tracks
 
     # Method 2: fallback HTML parsing (best-effort)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
 
     # Genius album pages often have track rows with track numbers/titles visible.
     # We'll try multiple selectors.
@@ -233,7 +266,7 @@ def scrape_album_tracklist(album_url: str, expected_album_name: str) -> List[Tup
     for row in rows:
         text = row.get_text(" ", strip=True)
         # Try to parse "1. Track Title"
-        m = re.match(r"^(\d+)\.?\s+(.*)$", text)
+        m = _RE_TRACK_ROW.match(text)
         if m:
             tn = int(m.group(1))
             title = m.group(2)
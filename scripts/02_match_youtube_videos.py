@@ -1,11 +1,13 @@
 # scripts/02_match_youtube_videos.py
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
 import pandas as pd
 import requests
 import isodate
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -15,6 +17,13 @@ OUT_VIDEOS = DATA_DIR / "youtube_videos.csv"
 
 YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
 
+# Concurrent /videos batch requests (each batch is 50 IDs = 1 quota unit)
+MAX_WORKERS = 6
+
+# One keep-alive session for every request (reuses TCP/TLS connections)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 # Your known official channel (handle -> channelId lookup is fine too)
 CHANNEL_ID = "UC0KAFLxIiaR_FFNYDL3utGw"
 
@@ -25,11 +34,33 @@ ALBUM_TITLE = "Don't Be Dumb"
 ALBUM_PLAYLIST_ID = "OLAK5uy_lW4LAXRvQ_YHM7eNelKA0uAYUcpgL1b8g"
 
 
+class _NormalizeTable(dict):
+    """
+    str.translate table for normalize(): keeps a-z, 0-9 and apostrophes (’ becomes '),
+    maps every other character to a space. Entries are filled in lazily on first use.
+    """
+
+    _KEEP = frozenset("abcdefghijklmnopqrstuvwxyz0123456789'")
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        out = ch if ch in self._KEEP else ("'" if ch == "’" else " ")
+        self[code] = out
+        return out
+
+
+_NORMALIZE_TABLE = _NormalizeTable()
+
+
 def normalize(s: str) -> str:
-    s = (s or "").lower()
-    s = s.replace("’", "'")
-    s = re.sub(r"[^a-z0-9\s']", " ", s)
-    return re.sub(r"\s+", " ", s).strip()
+    # Whitespace and punctuation both become spaces; split/join collapses and strips them
+    return " ".join((s or "").lower().translate(_NORMALIZE_TABLE).split())
+
+
+def _get_json(url: str, **kwargs) -> dict:
+    r = SESSION.get(url, **kwargs)
+    r.raise_for_status()
+    return orjson.loads(r.content)
 
 
 def duration_seconds(iso):
@@ -43,7 +74,7 @@ def yt_search_album_playlist(api_key: str, channel_id: str, album_title: str) ->
     """
     Searches playlists on the channel for the album title and returns the best playlistId.
     """
-    r = requests.get(
+    data = _get_json(
         f"{YOUTUBE_API_BASE}/search",
         params={
             "key": api_key,
@@ -55,8 +86,7 @@ def yt_search_album_playlist(api_key: str, channel_id: str, album_title: str) ->
         },
         timeout=30,
     )
-    r.raise_for_status()
-    items = r.json().get("items", [])
+    items = data.get("items", [])
     if not items:
         raise RuntimeError("No playlist search results found for album title on this channel.")
 
@@ -91,7 +121,7 @@ def yt_get_all_playlist_videos(api_key: str, playlist_id: str):
     page_token = None
 
     while True:
-        r = requests.get(
+        data = _get_json(
             f"{YOUTUBE_API_BASE}/playlistItems",
             params={
                 "key": api_key,
@@ -102,8 +132,6 @@ def yt_get_all_playlist_videos(api_key: str, playlist_id: str):
             },
             timeout=30,
         )
-        r.raise_for_status()
-        data = r.json()
 
         for item in data.get("items", []):
             vid = item["contentDetails"]["videoId"]
@@ -118,22 +146,25 @@ def yt_get_all_playlist_videos(api_key: str, playlist_id: str):
     return videos
 
 
+def _fetch_durations_batch(api_key: str, batch):
+    data = _get_json(
+        f"{YOUTUBE_API_BASE}/videos",
+        params={
+            "key": api_key,
+            "part": "contentDetails",
+            "id": ",".join(batch),
+        },
+        timeout=30,
+    )
+    return {it["id"]: duration_seconds(it["contentDetails"].get("duration")) for it in data.get("items", [])}
+
+
 def yt_get_video_durations(api_key: str, video_ids):
+    batches = [video_ids[i : i + 50] for i in range(0, len(video_ids), 50)]
     durations = {}
-    for i in range(0, len(video_ids), 50):
-        batch = video_ids[i : i + 50]
-        r = requests.get(
-            f"{YOUTUBE_API_BASE}/videos",
-            params={
-                "key": api_key,
-                "part": "contentDetails",
-                "id": ",".join(batch),
-            },
-            timeout=30,
-        )
-        r.raise_for_status()
-        for it in r.json().get("items", []):
-            durations[it["id"]] = duration_seconds(it["contentDetails"].get("duration"))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for batch_durations in ex.map(lambda batch: _fetch_durations_batch(api_key, batch), batches):
+            durations.update(batch_durations)
     return durations
 
 
@@ -143,7 +174,12 @@ def main():
     if not api_key:
         raise RuntimeError("Missing YOUTUBE_API_KEY in .env")
 
-    tracks = pd.read_csv(IN_TRACKS)
+    # Only three columns are used; fixed dtypes skip pandas' type inference
+    tracks = pd.read_csv(
+        IN_TRACKS,
+        usecols=["track_id", "track_number", "track_name"],
+        dtype={"track_id": str, "track_number": int, "track_name": str},
+    )
 
     playlist_id = ALBUM_PLAYLIST_ID
     if not playlist_id:
@@ -155,33 +191,36 @@ def main():
     video_ids = [v["video_id"] for v in album_videos]
     durations = yt_get_video_durations(api_key, video_ids)
 
+    # Playlist columns as parallel lists, titles normalized once. The length check
+    # doesn't depend on the track, so too-short videos are dropped up front.
+    eligible = [v for v in album_videos if (durations.get(v["video_id"]) or 0) >= 30]  # audio tracks can be short-ish
+    vids = [v["video_id"] for v in eligible]
+    titles = [v["title"] for v in eligible]
+    published = [v["published_at"] for v in eligible]
+    norm_titles = [normalize(title) for title in titles]
+
     # Map tracks -> one best video from this album playlist
     rows = []
-    for _, t in tracks.sort_values("track_number").iterrows():
-        track_norm = normalize(t["track_name"])
-
-        # Find first playlist video whose title contains the track name and is long enough
-        chosen = None
-        for v in album_videos:
-            title_norm = normalize(v["title"])
-            if track_norm in title_norm:
-                if (durations.get(v["video_id"]) or 0) >= 30:  # audio tracks can be short-ish
-                    chosen = v
-                    break
+    for t in tracks.sort_values("track_number").itertuples(index=False):
+        track_norm = normalize(t.track_name)
+
+        # Find first playlist video whose title contains the track name
+        i = next((i for i, title_norm in enumerate(norm_titles) if track_norm in title_norm), None)
+        chosen = i is not None
 
         rows.append(
             {
-                "track_id": t["track_id"],
-                "youtube_video_id": chosen["video_id"] if chosen else None,
-                "youtube_title": chosen["title"] if chosen else None,
+                "track_id": t.track_id,
+                "youtube_video_id": vids[i] if chosen else None,
+                "youtube_title": titles[i] if chosen else None,
                 "channel_title": "A$AP Rocky (Releases)",
-                "published_at": chosen["published_at"] if chosen else None,
+                "published_at": published[i] if chosen else None,
                 "is_official": True,
                 "match_confidence": "high" if chosen else "none",
             }
         )
 
-        print(f'{t["track_number"]:02d} {t["track_name"]} -> {chosen["video_id"] if chosen else "NO MATCH"}')
+        print(f'{t.track_number:02d} {t.track_name} -> {vids[i] if chosen else "NO MATCH"}')
 
     pd.DataFrame(rows).to_csv(OUT_VIDEOS, index=False)
     print(f"Wrote {OUT_VIDEOS}")
@@ -9,13 +9,16 @@ Purpose:
 Run daily (or every few days). Uses UTC consistently.
 """
 
+import csv
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
-import pandas as pd
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 
 FORCE_RUN = False  # set to False after testing
@@ -29,9 +32,17 @@ DATA_DIR = PROJECT_ROOT / "data"
 
 IN_VIDEOS = DATA_DIR / "youtube_videos.csv"
 OUT_STATS = DATA_DIR / "youtube_stats_snapshots.csv"
+STATS_COLUMNS = ["youtube_video_id", "captured_at", "view_count", "like_count", "comment_count"]
 
 YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
 
+# One keep-alive session for every request (reuses TCP/TLS connections)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Concurrent /videos batch requests (each batch is 50 IDs = 1 quota unit)
+MAX_WORKERS = 6
+
 # Evening snapshot window in UTC
 EVENING_START_UTC = 18  # 18:00 UTC
 EVENING_END_UTC = 22    # 22:00 UTC
@@ -40,36 +51,48 @@ EVENING_END_UTC = 22    # 22:00 UTC
 # -----------------------------
 # Helpers
 # -----------------------------
+def _get_json(url: str, **kwargs) -> dict:
+    r = SESSION.get(url, **kwargs)
+    r.raise_for_status()
+    return orjson.loads(r.content)
+
+
+def _fetch_stats_batch(api_key: str, batch: list[str]) -> dict:
+    data = _get_json(
+        f"{YOUTUBE_API_BASE}/videos",
+        params={
+            "key": api_key,
+            "part": "statistics",
+            "id": ",".join(batch),
+        },
+        timeout=30,
+    )
+
+    stats = {}
+    for item in data.get("items", []):
+        vid = item["id"]
+        s = item.get("statistics", {})
+
+        stats[vid] = {
+            "view_count": int(s.get("viewCount", 0)),
+            "like_count": int(s.get("likeCount", 0)) if "likeCount" in s else None,
+            "comment_count": int(s.get("commentCount", 0)) if "commentCount" in s else None,
+        }
+
+    return stats
+
+
 def yt_get_video_stats(api_key: str, video_ids: list[str]) -> dict:
     """
-    Fetch statistics for up to 50 videos at a time.
+    Fetch statistics for up to 50 videos at a time (batches run concurrently).
     Returns: { video_id: {view_count, like_count, comment_count} }
     """
-    stats = {}
-
-    for i in range(0, len(video_ids), 50):
-        batch = video_ids[i : i + 50]
-
-        r = requests.get(
-            f"{YOUTUBE_API_BASE}/videos",
-            params={
-                "key": api_key,
-                "part": "statistics",
-                "id": ",".join(batch),
-            },
-            timeout=30,
-        )
-        r.raise_for_status()
+    batches = [video_ids[i : i + 50] for i in range(0, len(video_ids), 50)]
 
-        for item in r.json().get("items", []):
-            vid = item["id"]
-            s = item.get("statistics", {})
-
-            stats[vid] = {
-                "view_count": int(s.get("viewCount", 0)),
-                "like_count": int(s.get("likeCount", 0)) if "likeCount" in s else None,
-                "comment_count": int(s.get("commentCount", 0)) if "commentCount" in s else None,
-            }
+    stats = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for batch_stats in ex.map(lambda batch: _fetch_stats_batch(api_key, batch), batches):
+            stats.update(batch_stats)
 
     return stats
 
@@ -104,15 +127,10 @@ def main():
     else:
         print("[TEST MODE] FORCE_RUN is True; skipping time window check.")
     
-    videos_df = pd.read_csv(IN_VIDEOS)
-
-    video_ids = (
-        videos_df["youtube_video_id"]
-        .dropna()
-        .astype(str)
-        .unique()
-        .tolist()
-    )
+    # Only the unique, non-empty video IDs are needed; read them with the csv module
+    with open(IN_VIDEOS, newline="", encoding="utf-8") as f:
+        ids = (row["youtube_video_id"] for row in csv.DictReader(f))
+        video_ids = list(dict.fromkeys(vid for vid in ids if vid))
 
     if not video_ids:
         raise RuntimeError("No valid YouTube video IDs found.")
@@ -135,20 +153,20 @@ def main():
             }
         )
 
-    snapshot_df = pd.DataFrame(rows)
-
-    if snapshot_df.empty:
+    if not rows:
         print("[WARN] No stats returned from API.")
         return
 
-    # Append snapshots (never overwrite)
-    if OUT_STATS.exists():
-        snapshot_df.to_csv(OUT_STATS, mode="a", header=False, index=False)
-    else:
-        snapshot_df.to_csv(OUT_STATS, index=False)
+    # Append snapshots (never overwrite). Rows are written with the csv module
+    # directly; os.linesep matches the line endings pandas used for this file.
+    with open(OUT_STATS, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=STATS_COLUMNS, lineterminator=os.linesep)
+        if f.tell() == 0:
+            writer.writeheader()
+        writer.writerows(rows)
 
     print(
-        f"[OK] Captured stats for {len(snapshot_df)} videos "
+        f"[OK] Captured stats for {len(rows)} videos "
         f"at {now_utc.isoformat()} UTC"
     )
     print(f"[OK] Saved to {OUT_STATS}")
@@ -12,10 +12,10 @@ What it does:
   - removes multi-line section headers like [Chorus: ...]
   - removes other Genius junk (You might also like, Embed, language menu items, etc.)
 - Computes metrics (word count, unique word count, repetition ratio)
-- Appends to data/lyrics.csv
+- Appends to data/lyrics.csv (and the same rows to data/lyrics.jsonl)
 
 Requirements:
-  pip install pandas requests beautifulsoup4 python-dotenv
+  pip install requests requests-cache orjson beautifulsoup4 lxml python-dotenv
 
 .env (project root) should contain:
   GENIUS_API_KEY=YOUR_TOKEN
@@ -23,17 +23,25 @@ Requirements:
 
 from __future__ import annotations
 
+import csv
+import html
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import pandas as pd
-import requests
+import orjson
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 # -----------------------------
 # Config
@@ -44,6 +52,21 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 IN_TRACKS = DATA_DIR / "tracks.csv"
 OUT_LYRICS = DATA_DIR / "lyrics.csv"
+# JSON-lines copy of every row appended to lyrics.csv since that file was (re)created,
+# for consumers that don't want to parse the quoted lyrics column
+OUT_LYRICS_JSONL = DATA_DIR / "lyrics.jsonl"
+# One "<track_id> <lyrics.csv size>" line per row in lyrics.csv, so startup doesn't
+# re-read the CSV; the size on the last line shows whether the two are still in step
+DONE_FILE = DATA_DIR / "lyrics.done.txt"
+LYRICS_COLUMNS = [
+    "track_id",
+    "track_name",
+    "genius_url",
+    "lyrics",
+    "word_count",
+    "unique_word_count",
+    "repetition_ratio",
+]
 
 GENIUS_API_BASE = "https://api.genius.com"
 
@@ -56,42 +79,230 @@ DEFAULT_HEADERS = {
 }
 
 REQUEST_TIMEOUT = 30
-SLEEP_BETWEEN_REQUESTS_SEC = 0.25
+MAX_PAGE_BYTES = 1_500_000
+GENIUS_MAX_RPS = 4  # network requests per second, across all worker threads
+MAX_WORKERS = 8
+
+HTTP_CACHE = DATA_DIR / "http_cache.sqlite"
 
 
 # -----------------------------
 # Helpers: cleaning & IDs
 # -----------------------------
+_RE_CRLF = re.compile(r"\r\n?")
+_RE_SPACES = re.compile(r"[ \t]+")
+_RE_WS = re.compile(r"\s+")
+# View counts like 108.2K / 3.1M and the "Lyrics" suffix, removed in one pass
+_RE_TRACK_JUNK = re.compile(r"\b\d+(?:\.\d+)?[KMB]\b|\bLyrics\b", re.IGNORECASE)
+_RE_PAREN_SPACING = re.compile(r"\s+\)|\(\s+")
+
+
 def normalize_whitespace(s: str) -> str:
-    s = re.sub(r"\r\n?", "\n", s)
-    s = re.sub(r"[ \t]+", " ", s)
-    s = re.sub(r"\n{3,}", "\n\n", s)
+    s = _RE_CRLF.sub("\n", s)
+    s = _RE_SPACES.sub(" ", s)
+    # Collapse 3+ newlines to a blank line with plain substring search (usually no-op)
+    while "\n\n\n" in s:
+        s = s.replace("\n\n\n", "\n\n")
     return s.strip()
 
 
+def _paren_fix(m: re.Match) -> str:
+    return ")" if m.group(0).endswith(")") else "("
+
+
 def clean_track_name(name: str) -> str:
     """
     Remove view counts / "Lyrics" / extra spacing from scraped track titles.
     """
     if name is None:
         return ""
-    s = str(name).strip()
-    s = re.sub(r"\s+", " ", s)
-
-    # remove things like 108.2K, 3.1M etc
-    s = re.sub(r"\b\d+(\.\d+)?[KMB]\b", "", s, flags=re.IGNORECASE)
-
-    # remove trailing "Lyrics"
-    s = re.sub(r"\bLyrics\b", "", s, flags=re.IGNORECASE)
+    # remove things like 108.2K, 3.1M etc and trailing "Lyrics"
+    s = _RE_TRACK_JUNK.sub("", str(name))
 
     # tighten parentheses spacing
-    s = re.sub(r"\s+\)", ")", s)
-    s = re.sub(r"\(\s+", "(", s)
+    s = _RE_PAREN_SPACING.sub(_paren_fix, s)
 
-    s = re.sub(r"\s{2,}", " ", s)
+    s = _RE_WS.sub(" ", s)
     return s.strip(" -–—")
 
 
+# Smart apostrophes/quotes and common dash variants -> ASCII, in one translate pass
+_TITLE_TRANS = str.maketrans({
+    "\u2019": "'",  # '
+    "\u2018": "'",  # '
+    "\u201c": '"',  # "
+    "\u201d": '"',  # "
+    "\u2013": "-",  # –
+    "\u2014": "-",  # —
+})
+
+
+# Helper to normalize punctuation for title matching (handles curly quotes, smart dashes, etc.)
+# Cached: lyric lines (choruses especially) repeat within and across songs.
+@lru_cache(maxsize=128)
+def _norm_for_title_match(s: str) -> str:
+    return _RE_WS.sub(" ", s.lower().strip().translate(_TITLE_TRANS))
+
+
+# Patterns used by clean_lyrics_text, compiled once at import
+# NOTE: [^]] includes newlines too, so _RE_SECTION_HDR catches multi-line headers.
+_RE_SECTION_HDR = re.compile(
+    r"\[(?:(?:pre|post)-?chorus|chorus|verse|bridge|intro|outro|refrain|hook|interlude|skit)[^]]*\]",
+    re.IGNORECASE,
+)
+_RE_PAREN_INNER = re.compile(r"\(\s*([\s\S]*?)\s*\)")
+# Everything from the first "You might also like" or "Embed" line onwards
+_RE_FOOTER_JUNK = re.compile(r"\n\s*(?:You might also like|Embed)\s*\n.*", re.IGNORECASE | re.DOTALL)
+_RE_CONTRIB = re.compile(r"\d+\s+contributors?", re.IGNORECASE)
+_RE_TRANSL = re.compile(r"translations?", re.IGNORECASE)
+_RE_SINGLE = re.compile(r"\b(?:lead|debut|second|third|promotional)\s+single\b")
+_RE_DET_SINGLE = re.compile(r"\b(?:the|a|this|that|his|her|their|its)\s+single\b")
+_RE_MONTH = re.compile(
+    r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b",
+    re.IGNORECASE,
+)
+_RE_YEAR = re.compile(r"\b(19|20)\d{2}\b")
+
+
+# About-language that gives away a description blurb near the top of the lyrics
+TOP_DESCRIPTION_PHRASES = (
+    "is the",
+    "track off",
+    "studio album",
+    "highly anticipated",
+    "featuring",
+    "the track is about",
+    "this track is about",
+    "the song is about",
+    "produced by",
+    "released",
+    "release",
+    "read more",
+)
+
+# Strong metadata signals (safe to remove when present in reasonably long lines)
+STRONG_META_PHRASES = (
+    "released",
+    "music video",
+    "released on",
+    "released in",
+    "premiered",
+    "announced",
+    "release was announced",
+)
+
+# Weaker phrases that are common words and may appear in lyrics; only
+# treat them as metadata when they appear with the track name or other
+# strong context.
+WEAK_META_PHRASES = (
+    "album",
+    "in conjunction",
+    "in anticipation",
+    "produced by",
+    "followed",
+    "featuring",
+    "feat.",
+)
+
+SINGLE_CONTEXT_PHRASES = STRONG_META_PHRASES + ("album", "track", "song")
+
+
+def _phrase_re(phrases) -> re.Pattern:
+    """
+    One alternation that matches if any of the phrases is a substring.
+    """
+    return re.compile("|".join(map(re.escape, phrases)))
+
+
+_RE_TOP_DESCRIPTION = _phrase_re(TOP_DESCRIPTION_PHRASES)
+_RE_STRONG_META = _phrase_re(STRONG_META_PHRASES)
+_RE_WEAK_META = _phrase_re(WEAK_META_PHRASES)
+_RE_SINGLE_CONTEXT = _phrase_re(SINGLE_CONTEXT_PHRASES)
+
+
+# Genius language menu entries that leak into the lyrics text
+LANGUAGE_MENU = frozenset({
+    "Deutsch",
+    "Türkçe",
+    "Русский",
+    "Русский (Russian)",
+    "Português",
+    "Español",
+    "Français",
+    "Italiano",
+    "Nederlands",
+    "Polski",
+    "Svenska",
+    "한국어",
+    "日本語",
+    "中文",
+    "العربية",
+    "हिन्दी",
+    "Bahasa Indonesia",
+})
+
+
+def looks_like_description_line(s: str, sl: str, tn_lower: str) -> bool:
+    """
+    s is a stripped, non-empty line and sl its lowercase form; tn_lower is the
+    normalized track name.
+    """
+    # mentions title + typical about-language
+    if tn_lower and tn_lower in sl and _RE_TOP_DESCRIPTION.search(sl):
+        return True
+
+    # generic about-language near top (often long sentences)
+    if len(s) > 40 and _RE_TOP_DESCRIPTION.search(sl):
+        return True
+
+    # teaser ellipsis lines
+    if s.endswith("…") or s.endswith("..."):
+        return True
+
+    return False
+
+
+def looks_like_description_anywhere(s: str, sl: str, tn_lower: str) -> bool:
+    """
+    Same arguments as looks_like_description_line, but only flags lines that read
+    like release metadata, since it runs over the whole text.
+    """
+    # If a long line contains any strong metadata phrase, drop it.
+    if len(s) > 30 and _RE_STRONG_META.search(sl):
+        return True
+
+    # If a weak phrase appears together with the track title, it's likely
+    # part of a description and can be removed when long.
+    if tn_lower and len(s) > 30 and tn_lower in sl and _RE_WEAK_META.search(sl):
+        return True
+
+    # The word "single" is common in lyrics (e.g. "every single little...")
+    # Only treat it as metadata when it clearly means a release "single".
+    if "single" in sl:
+        # Clear music-release phrases like "lead single", "debut single", etc.
+        if _RE_SINGLE.search(sl) and len(s) > 30:
+            return True
+
+        # "the single" / "a single" can be metadata, but require extra context words
+        if _RE_DET_SINGLE.search(sl):
+            if len(s) > 30 and _RE_SINGLE_CONTEXT.search(sl):
+                return True
+
+    # Month name + reasonably long -> likely a release sentence
+    if _RE_MONTH.search(sl) and len(s) > 20:
+        return True
+
+    # Year-like patterns can be real lyrics (e.g., "That was 2015")
+    # Only remove if it ALSO looks like metadata (released/premiered/etc.)
+    if _RE_YEAR.search(s):
+        if len(s) > 30 and _RE_STRONG_META.search(sl):
+            return True
+        # Otherwise, keep it as lyrics
+        return False
+
+    return False
+
+
 def clean_lyrics_text(raw: str, track_name: str) -> str:
     """
     Cleans Genius lyric text:
@@ -102,82 +313,25 @@ def clean_lyrics_text(raw: str, track_name: str) -> str:
     if not raw:
         return ""
 
-    text = re.sub(r"\r\n?", "\n", raw)
+    text = _RE_CRLF.sub("\n", raw)
 
     # Remove multi-line section headers like:
     # [Chorus: A$AP Rocky,
     #  Brent Faiyaz
     #  &
     #  Both]
-    # NOTE: [^]] includes newlines too, so this catches multi-line headers.
-    text = re.sub(
-        r"\[(?:(?:pre|post)-?chorus|chorus|verse|bridge|intro|outro|refrain|hook|interlude|skit)[^]]*\]",
-        "",
-        text,
-        flags=re.IGNORECASE,
-    )
+    text = _RE_SECTION_HDR.sub("", text)
 
     # normalize spacing inside parentheses (keep adlibs)
-    text = re.sub(r"\(\s*([\s\S]*?)\s*\)", r"(\1)", text)
+    text = _RE_PAREN_INNER.sub(r"(\1)", text)
 
     # remove common footer junk
-    text = re.sub(r"\n\s*You might also like\s*\n.*", "\n", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"\n\s*Embed\s*\n.*$", "\n", text, flags=re.IGNORECASE | re.DOTALL)
-
-    # --- Remove Genius "About" description blurb if it got mixed into the top ---
-    # Normalize track name once for all title/description matching
-    def _norm_for_title_match_early(s: str) -> str:
-        s = s.lower().strip()
-        s = (s
-             .replace("\u2019", "'")  # '
-             .replace("\u2018", "'")  # '
-             .replace("\u201c", '"')  # "
-             .replace("\u201d", '"')  # "
-             )
-        s = (s
-             .replace("\u2013", "-")  # –
-             .replace("\u2014", "-")  # —
-             )
-        s = re.sub(r"\s+", " ", s)
-        return s
-
-    tn_lower = _norm_for_title_match_early(track_name)
-    lines0 = [ln.strip() for ln in text.split("\n")]
-
-    def looks_like_description_line(ln: str) -> bool:
-        s = ln.strip()
-        if not s:
-            return False
-        sl = s.lower()
-
-        bad_phrases = [
-            "is the",
-            "track off",
-            "studio album",
-            "highly anticipated",
-            "featuring",
-            "the track is about",
-            "this track is about",
-            "the song is about",
-            "produced by",
-            "released",
-            "release",
-            "read more",
-        ]
-
-        # mentions title + typical about-language
-        if tn_lower and tn_lower in sl and any(p in sl for p in bad_phrases):
-            return True
+    text = _RE_FOOTER_JUNK.sub("\n", text)
 
-        # generic about-language near top (often long sentences)
-        if any(p in sl for p in bad_phrases) and len(s) > 40:
-            return True
-
-        # teaser ellipsis lines
-        if s.endswith("…") or s.endswith("..."):
-            return True
-
-        return False
+    # Normalize track name once for all title/description matching;
+    # title lines look like "<track name> lyrics" once normalized
+    tn_lower = _norm_for_title_match(track_name)
+    tn_title_line = f"{tn_lower} lyrics"
 
     # Drop description-like lines that appear within the first few non-empty
     # lines (some Genius pages insert short metadata lines or blank lines
@@ -185,70 +339,22 @@ def clean_lyrics_text(raw: str, track_name: str) -> str:
     # lines rather than requiring it to be the very first line.
     max_top_nonempty = 8
     nonempty_seen = 0
-    i = 0
-    while i < len(lines0) and nonempty_seen < max_top_nonempty:
-        if not lines0[i].strip():
-            i += 1
-            continue
-
-        if looks_like_description_line(lines0[i]):
-            lines0.pop(i)
-            # do not increment i so next item shifts into this index
-            continue
-
-        nonempty_seen += 1
-        i += 1
-
-    text = "\n".join(lines0)
-
-    # Line-level cleanup
-    lines = [ln.strip() for ln in text.split("\n")]
-
-    language_menu = {
-        "Deutsch",
-        "Türkçe",
-        "Русский",
-        "Русский (Russian)",
-        "Português",
-        "Español",
-        "Français",
-        "Italiano",
-        "Nederlands",
-        "Polski",
-        "Svenska",
-        "한국어",
-        "日本語",
-        "中文",
-        "العربية",
-        "हिन्दी",
-        "Bahasa Indonesia",
-    }
-
-    # Helper to normalize punctuation for title matching (handles curly quotes, smart dashes, etc.)
-    def _norm_for_title_match(s: str) -> str:
-        s = s.lower().strip()
-        # Normalize smart apostrophes/quotes to ASCII using Unicode escapes
-        s = (s
-             .replace("\u2019", "'")  # '
-             .replace("\u2018", "'")  # '
-             .replace("\u201c", '"')  # "
-             .replace("\u201d", '"')  # "
-             )
-        # Normalize common dash variants
-        s = (s
-             .replace("\u2013", "-")  # –
-             .replace("\u2014", "-")  # —
-             )
-        # Normalize whitespace
-        s = re.sub(r"\s+", " ", s)
-        return s
 
+    # Line-level cleanup, single forward pass
     cleaned_lines: List[str] = []
-    for ln in lines:
+    for ln in text.split("\n"):
+        ln = ln.strip()
         if not ln:
             continue
 
-        if ln in language_menu:
+        sl = ln.lower()
+
+        if nonempty_seen < max_top_nonempty:
+            if looks_like_description_line(ln, sl, tn_lower):
+                continue
+            nonempty_seen += 1
+
+        if ln in LANGUAGE_MENU:
             continue
 
         # redundant now, but harmless
@@ -258,97 +364,25 @@ def clean_lyrics_text(raw: str, track_name: str) -> str:
         # remove title lines like "DON'T BE DUMB / TRIP BABY Lyrics" (handles curly quotes, dashes, etc.)
         if tn_lower:
             ln_norm = _norm_for_title_match(ln)
-            tn_norm = _norm_for_title_match(track_name)
 
-            if ln_norm == f"{tn_norm} lyrics":
+            if ln_norm == tn_title_line:
                 continue
-            if ln_norm.endswith(" lyrics") and tn_norm in ln_norm:
+            if ln_norm.endswith(" lyrics") and tn_lower in ln_norm:
                 continue
 
         # remove contributors/translations lines if they show up
-        if re.fullmatch(r"\d+\s+contributors?", ln, flags=re.IGNORECASE):
+        if _RE_CONTRIB.fullmatch(ln):
             continue
-        if re.fullmatch(r"translations?", ln, flags=re.IGNORECASE):
+        if _RE_TRANSL.fullmatch(ln):
             continue
 
-        cleaned_lines.append(ln)
-
-    # --- Remove description-like lines anywhere in the text ---
-    def looks_like_description_anywhere(ln: str) -> bool:
-        s = ln.strip()
-        if not s:
-            return False
-        sl = s.lower()
-
-
-        # Strong metadata signals (safe to remove when present in reasonably long lines)
-        strong_phrases = [
-            "released",
-            "music video",
-            "released on",
-            "released in",
-            "premiered",
-            "announced",
-            "release was announced",
-        ]
-
-        # Weaker phrases that are common words and may appear in lyrics; only
-        # treat them as metadata when they appear with the track name or other
-        # strong context.
-        weak_phrases = [
-            "album",
-            "in conjunction",
-            "in anticipation",
-            "produced by",
-            "followed",
-            "featuring",
-            "feat.",
-        ]
-
-        # If a long line contains any strong metadata phrase, drop it.
-        if any(p in sl for p in strong_phrases) and len(s) > 30:
-            return True
-
-        # If a weak phrase appears together with the track title, it's likely
-        # part of a description and can be removed when long.
-        if tn_lower and any(p in sl for p in weak_phrases) and tn_lower in sl and len(s) > 30:
-            return True
-
-        # The word "single" is common in lyrics (e.g. "every single little...")
-        # Only treat it as metadata when it clearly means a release "single".
-        if "single" in sl:
-            # Clear music-release phrases like "lead single", "debut single", etc.
-            if re.search(r"\b(?:lead|debut|second|third|promotional)\s+single\b", sl) and len(s) > 30:
-                return True
-
-            # "the single" / "a single" can be metadata, but require extra context words
-            if re.search(r"\b(?:the|a|this|that|his|her|their|its)\s+single\b", sl):
-                if len(s) > 30 and any(p in sl for p in (strong_phrases + ["album", "track", "song"])):
-                    return True
-
-
-        # Month name + reasonably long -> likely a release sentence
-        if re.search(
-            r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b",
-            sl,
-            flags=re.IGNORECASE,
-        ) and len(s) > 20:
-            return True
-
-        # Year-like patterns can be real lyrics (e.g., "That was 2015")
-        # Only remove if it ALSO looks like metadata (released/premiered/etc.)
-        if re.search(r"\b(19|20)\d{2}\b", s):
-            if any(p in sl for p in strong_phrases) and len(s) > 30:
-                return True
-            # Otherwise, keep it as lyrics
-            return False
-
-
-        return False
+        # description-like lines anywhere in the text
+        if looks_like_description_anywhere(ln, sl, tn_lower):
+            continue
 
-    filtered_lines = [ln for ln in cleaned_lines if not looks_like_description_anywhere(ln)]
+        cleaned_lines.append(ln)
 
-    out = "\n".join(filtered_lines)
+    out = "\n".join(cleaned_lines)
     out = normalize_whitespace(out)
     return "\n" + out.strip()
 
@@ -359,31 +393,116 @@ def clean_lyrics_text(raw: str, track_name: str) -> str:
 WORD_RE = re.compile(r"[A-Za-z0-9']+")
 
 
-def _tokenize_words(text: str) -> List[str]:
+def lyric_metrics(text: str) -> Tuple[int, int, float]:
+    """
+    Word count, unique word count and a simple repetition score:
+      1 - (unique_words / total_words)
+    All three come from a single pass over the tokens.
+    """
     if not text:
-        return []
-    return [w.lower() for w in WORD_RE.findall(text)]
+        return 0, 0, 0.0
+    # Lowercase the whole text once instead of every token when it is ASCII. Otherwise
+    # lower each token: some non-ASCII capitals ("İ", Kelvin sign) lowercase to ASCII
+    # letters and would form new tokens. Only the distinct words and a running total
+    # are kept.
+    if text.isascii():
+        tokens = (m.group() for m in WORD_RE.finditer(text.lower()))
+    else:
+        tokens = (m.group().lower() for m in WORD_RE.finditer(text))
+    total = 0
+    words = set()
+    for w in tokens:
+        total += 1
+        words.add(w)
+    if total == 0:
+        return 0, 0, 0.0
+    unique = len(words)
+    return total, unique, round(1.0 - (unique / total), 6)
+
+
+# -----------------------------
+# HTTP session & throttling
+# -----------------------------
+class RateLimiter:
+    """
+    Spaces calls to wait() at least 1/rps seconds apart across threads.
+    Each caller reserves the next free slot and only sleeps until that slot comes up,
+    so there is no wait at all when the previous request was slower than the interval.
+    """
 
+    def __init__(self, rps: float):
+        self.min_interval = 1.0 / rps
+        self._next_at = 0.0
+        self._lock = threading.Lock()
 
-def count_words(text: str) -> int:
-    return len(_tokenize_words(text))
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
 
 
-def count_unique_words(text: str) -> int:
-    return len(set(_tokenize_words(text)))
+RATE_LIMITER = RateLimiter(GENIUS_MAX_RPS)
 
 
-def repetition_ratio(text: str) -> float:
+class _ThrottledAdapter(HTTPAdapter):
     """
-    Simple repetition score:
-      1 - (unique_words / total_words)
+    Throttles requests that actually go out over the network.
+    Responses served from the HTTP cache never reach the adapter, so they are not delayed.
     """
-    words = _tokenize_words(text)
-    total = len(words)
-    if total == 0:
-        return 0.0
-    unique = len(set(words))
-    return round(1.0 - (unique / total), 6)
+
+    def send(self, request, **kwargs):
+        RATE_LIMITER.wait()
+        return super().send(request, **kwargs)
+
+
+class _ThrottledRetry(Retry):
+    """
+    urllib3 re-sends retries below the adapter's send(), so they would bypass
+    RATE_LIMITER; take a slot after the backoff / Retry-After sleep as well.
+    (urllib3 2.x doesn't back off at all before the first retry.)
+    """
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        RATE_LIMITER.wait()
+
+
+# Back off and retry only when Genius pushes back (429) or errors (5xx);
+# Retry-After is honoured when sent.
+RETRY = _ThrottledRetry(
+    total=5,
+    backoff_factor=1,
+    backoff_jitter=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+)
+
+# One keep-alive session for every request (reuses TCP/TLS connections).
+# Successful GET responses are cached on disk for a week so re-runs skip the network;
+# once expired they are revalidated (ETag / Last-Modified) and a stale copy is used
+# if Genius errors out. The browser User-Agent is set once here; the Genius bearer
+# token is only added on API calls so it is never sent to the public song pages.
+SESSION = CachedSession(
+    str(HTTP_CACHE),
+    expire_after=timedelta(days=7),
+    allowable_methods=("GET",),
+    allowable_codes=(200,),
+    stale_if_error=True,
+)
+SESSION.headers.update(DEFAULT_HEADERS)
+SESSION.mount("https://", _ThrottledAdapter(max_retries=RETRY, pool_connections=4, pool_maxsize=16))
+
+
+def _get_json(url: str, session: CachedSession = SESSION, **kwargs) -> dict:
+    """
+    GET a JSON API endpoint through the shared session and parse the raw body with orjson.
+    """
+    r = session.get(url, **kwargs)
+    r.raise_for_status()
+    return orjson.loads(r.content)
 
 
 # -----------------------------
@@ -392,15 +511,20 @@ def repetition_ratio(text: str) -> float:
 @dataclass
 class GeniusClient:
     access_token: str
+    session: CachedSession = SESSION
 
     def _headers(self) -> Dict[str, str]:
-        return {"Authorization": f"Bearer {self.access_token}", **DEFAULT_HEADERS}
+        return {"Authorization": f"Bearer {self.access_token}"}
 
     def search_song(self, query: str) -> Optional[Dict]:
         url = f"{GENIUS_API_BASE}/search"
-        r = requests.get(url, headers=self._headers(), params={"q": query}, timeout=REQUEST_TIMEOUT)
-        r.raise_for_status()
-        data = r.json()
+        data = _get_json(
+            url,
+            session=self.session,
+            headers=self._headers(),
+            params={"q": query},
+            timeout=REQUEST_TIMEOUT,
+        )
         hits = data.get("response", {}).get("hits", [])
         return hits[0].get("result") if hits else None
 
@@ -421,17 +545,57 @@ def best_song_url_for_track(
 # -----------------------------
 # Scraping
 # -----------------------------
-def _join_lyrics_blocks(blocks: List) -> str:
+# One piece of a tag's body; a ">" inside a quoted attribute value doesn't end the tag
+_TAG_PART = rb"""(?:[^>"']|"[^"]*"|'[^']*')"""
+_RE_LYRICS_CONTAINER_OPEN = re.compile(
+    rb"<div\b" + _TAG_PART + rb'*?\sdata-lyrics-container="true"' + _TAG_PART + rb"*>"
+)
+_RE_DIV_TAG = re.compile(rb"<(/?)div\b" + _TAG_PART + rb"*>", re.IGNORECASE)
+_RE_ANY_TAG = re.compile(rb"<" + _TAG_PART + rb"+>")
+_RE_READ_MORE = re.compile(r"read more", re.IGNORECASE)
+
+
+def _extract_lyrics_containers(page: bytes) -> List[str]:
+    """
+    Pull the text of every div[data-lyrics-container="true"] straight from the raw HTML.
+    Nested <div>s are balanced to find each container's end; tags become line breaks
+    (same result as get_text("\n", strip=True)). Returns [] if the markup looks off.
+    """
+    texts: List[str] = []
+    pos = 0
+    while True:
+        m = _RE_LYRICS_CONTAINER_OPEN.search(page, pos)
+        if not m:
+            break
+
+        depth = 1
+        end = -1
+        for tag in _RE_DIV_TAG.finditer(page, m.end()):
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                end = tag.start()
+                pos = tag.end()
+                break
+        if end < 0:
+            return []
+
+        body = _RE_ANY_TAG.sub(b"\n", page[m.end():end]).decode("utf-8", errors="replace")
+        lines = (ln.strip() for ln in html.unescape(body).split("\n"))
+        texts.append("\n".join(ln for ln in lines if ln))
+
+    return texts
+
+
+def _join_lyrics_texts(texts: List[str]) -> str:
     parts: List[str] = []
-    for b in blocks:
-        t = b.get_text("\n", strip=True)
+    for t in texts:
         if not t:
             continue
 
         # Drop ONLY the "Read More" line(s), not everything after it
         lines: List[str] = []
         for ln in t.split("\n"):
-            if re.fullmatch(r"read more", ln.strip(), flags=re.IGNORECASE):
+            if _RE_READ_MORE.fullmatch(ln.strip()):
                 continue
             lines.append(ln)
 
@@ -442,58 +606,54 @@ def _join_lyrics_blocks(blocks: List) -> str:
     return "\n\n".join(parts).strip()
 
 
-def scrape_genius_lyrics(song_url: str) -> str:
+def _join_lyrics_blocks(blocks: List) -> str:
+    return _join_lyrics_texts([b.get_text("\n", strip=True) for b in blocks])
+
+
+def scrape_genius_lyrics(song_url: str, session: CachedSession = SESSION) -> str:
     """
     Scraper that targets the lyric root / containers (avoids page descriptions when possible).
     Now with a robust fallback that gathers ALL lyric containers on the page.
     """
-    r = requests.get(song_url, headers=DEFAULT_HEADERS, timeout=REQUEST_TIMEOUT)
-    r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
-
-    chunks: List[str] = []
-
-    # 1) Prefer lyric root if present
-    lyrics_root = soup.find("div", {"id": "lyrics-root-id"}) or soup.find("div", class_=re.compile(r"Lyrics__Root"))
-    if lyrics_root:
-        blocks = lyrics_root.find_all("div", {"data-lyrics-container": "true"})
-        if blocks:
-            chunks.append(_join_lyrics_blocks(blocks))
-
-    # 2) aria-label "Lyrics" section
-    blocks2 = soup.select('section[aria-label="Lyrics"] div[data-lyrics-container="true"]')
-    if blocks2:
-        chunks.append(_join_lyrics_blocks(blocks2))
-
-    # 3) GLOBAL fallback: any lyrics containers anywhere on the page
-    blocks3 = soup.select('div[data-lyrics-container="true"]')
-    if blocks3:
-        chunks.append(_join_lyrics_blocks(blocks3))
-
-    # 4) legacy fallback
+    # Read at most MAX_PAGE_BYTES of the page: the lyric containers are in the
+    # server-rendered HTML, ahead of the large embedded JSON state.
+    with session.get(song_url, timeout=REQUEST_TIMEOUT, stream=True) as r:
+        r.raise_for_status()
+        buf = bytearray()
+        for chunk in r.iter_content(1 << 16):
+            buf += chunk
+            if len(buf) >= MAX_PAGE_BYTES:
+                break
+    page = bytes(buf)
+
+    # Fast path: read the lyric containers directly from the raw HTML, no DOM
+    containers = _extract_lyrics_containers(page)
+    if containers:
+        return _dedupe_blocks(_join_lyrics_texts(containers))
+
+    soup = BeautifulSoup(page, "lxml")
+
+    # One pass for every lyrics container on the page, in document order. This covers
+    # the containers under the lyric root and the aria-label "Lyrics" section too.
+    blocks = soup.select('div[data-lyrics-container="true"]')
+    if blocks:
+        return _dedupe_blocks(_join_lyrics_blocks(blocks))
+
+    # legacy fallback
     legacy = soup.select_one("div.lyrics")
-    if legacy:
-        chunks.append(legacy.get_text("\n", strip=True))
+    return _dedupe_blocks(legacy.get_text("\n", strip=True)) if legacy else ""
+
 
-    # combine + de-dupe while preserving order
-    combined = "\n\n".join([c for c in chunks if c and c.strip()]).strip()
+def _dedupe_blocks(combined: str) -> str:
+    """
+    Light de-dupe: remove exact duplicate blocks, keeping the first occurrence.
+    """
     if not combined:
         return ""
 
-    # light de-dupe: remove exact duplicate blocks
-    seen = set()
-    out_blocks = []
-    for block in combined.split("\n\n"):
-        b = block.strip()
-        if not b:
-            continue
-        if b in seen:
-            continue
-        seen.add(b)
-        out_blocks.append(b)
-
-    return "\n\n".join(out_blocks).strip()
-
+    # dict.fromkeys keeps the first of each block, in order
+    blocks = (b.strip() for b in combined.split("\n\n"))
+    return "\n\n".join(dict.fromkeys(b for b in blocks if b)).strip()
 
 
 # -----------------------------
@@ -502,15 +662,68 @@ def scrape_genius_lyrics(song_url: str) -> str:
 def _already_done() -> set:
     """
     Track IDs that already exist in lyrics.csv (so we only do one new track per run).
+    Read from DONE_FILE; if that is missing or out of step with lyrics.csv (e.g. the
+    run was killed between the two writes) it is rebuilt from lyrics.csv.
     """
     if not OUT_LYRICS.exists():
+        # Starting over: a sidecar left from the old lyrics.csv must not count
+        DONE_FILE.unlink(missing_ok=True)
         return set()
+
+    csv_size = OUT_LYRICS.stat().st_size
+    if DONE_FILE.exists():
+        entries = [ln.split() for ln in DONE_FILE.read_text(encoding="utf-8").splitlines() if ln.strip()]
+        if entries and entries[-1][-1] == str(csv_size):
+            return {e[0] for e in entries}
+
     try:
-        done = pd.read_csv(OUT_LYRICS, usecols=["track_id"], dtype=str)
-        return set(done["track_id"].fillna("").str.strip())
+        # Only the track_id column is needed; scan it with the csv module
+        with open(OUT_LYRICS, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            col = next(reader).index("track_id")
+            done = {row[col].strip() for row in reader if len(row) > col}
     except Exception:
         # If the file exists but is malformed, treat as none done
+        DONE_FILE.unlink(missing_ok=True)
         return set()
+    done.discard("")
+    DONE_FILE.write_text("".join(f"{tid} {csv_size}\n" for tid in sorted(done)), encoding="utf-8")
+    return done
+
+
+def fetch_track_lyrics(gc: GeniusClient, row) -> Dict:
+    """
+    Look up, scrape and clean the lyrics for one track row.
+    Runs on a worker thread; returns the lyrics.csv row for that track.
+    """
+    track_id = str(row.get("track_id", "")).strip()
+    track_name = clean_track_name(str(row.get("track_name", "")).strip())
+    artist_name = str(row.get("artist_name", "A$AP Rocky")).strip()
+    album_name = row.get("album_name", None)
+    album_name = str(album_name).strip() if isinstance(album_name, str) and album_name.strip() else None
+
+    url = best_song_url_for_track(gc, track_name, artist_name, album_name)
+
+    lyrics = ""
+    if url:
+        try:
+            raw_lyrics = scrape_genius_lyrics(url, gc.session)
+            lyrics = clean_lyrics_text(raw_lyrics, track_name)
+        except Exception as e:
+            print(f"Error scraping {track_name}: {e}")
+            lyrics = ""
+
+    word_count, unique_word_count, rep_ratio = lyric_metrics(lyrics)
+
+    return {
+        "track_id": track_id,
+        "track_name": track_name,
+        "genius_url": url or "",
+        "lyrics": lyrics,
+        "word_count": word_count,
+        "unique_word_count": unique_word_count,
+        "repetition_ratio": rep_ratio,
+    }
 
 
 def main() -> None:
@@ -522,14 +735,15 @@ def main() -> None:
     if not IN_TRACKS.exists():
         raise SystemExit(f"Missing input file: {IN_TRACKS}")
 
-    tracks = pd.read_csv(IN_TRACKS)
     done_ids = _already_done()
-    # Process all unprocessed tracks in one run, appending each result immediately
-    targets = []
-    for i, row in tracks.iterrows():
-        tid = str(row.get("track_id", "")).strip()
-        if tid and tid not in done_ids:
-            targets.append((i, row))
+    # Process all unprocessed tracks in one run, appending each result immediately.
+    # Every column is handled as text, so the rows are streamed with csv.DictReader.
+    with open(IN_TRACKS, newline="", encoding="utf-8") as f:
+        targets = []
+        for row in csv.DictReader(f):
+            tid = (row.get("track_id") or "").strip()
+            if tid and tid not in done_ids:
+                targets.append(row)
 
     if not targets:
         print("All tracks are already processed.")
@@ -539,64 +753,71 @@ def main() -> None:
     print("=" * 60)
 
     gc = GeniusClient(access_token=token)
-    write_header = not OUT_LYRICS.exists()
-
-    for idx, (i, row) in enumerate(targets, 1):
-        track_id = str(row.get("track_id", "")).strip()
-        track_name = clean_track_name(str(row.get("track_name", "")).strip())
-        artist_name = str(row.get("artist_name", "A$AP Rocky")).strip()
-        album_name = row.get("album_name", None)
-        album_name = str(album_name).strip() if isinstance(album_name, str) and album_name.strip() else None
-
-        print(f"[{idx}/{len(targets)}] Fetching: {track_name}")
-        print("-" * 60)
 
-        url = best_song_url_for_track(gc, track_name, artist_name, album_name)
+    # Keep lyrics.csv open for the whole run and append rows with the csv module;
+    # os.linesep matches the line endings pandas used for this file.
+    out = open(OUT_LYRICS, "a", newline="", encoding="utf-8", buffering=1 << 16)
+    writer = csv.DictWriter(out, fieldnames=LYRICS_COLUMNS, lineterminator=os.linesep)
+    new_csv = out.tell() == 0
+    if new_csv:
+        writer.writeheader()
+    # A fresh lyrics.csv starts a fresh lyrics.jsonl, so the two hold the same rows
+    jsonl = open(OUT_LYRICS_JSONL, "wb" if new_csv else "ab", buffering=1 << 16)
+    done_file = open(DONE_FILE, "a", encoding="utf-8")
+
+    # Tracks are independent and network-bound, so fetch them on a thread pool.
+    # Results are handled as they finish (a slow page doesn't hold back the rest)
+    # and are only ever written from this thread, so the writer needs no lock.
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            futures = {ex.submit(fetch_track_lyrics, gc, row): row for row in targets}
 
-        lyrics = ""
-        if not url:
-            print("No Genius URL found.")
-        else:
-            print(f"URL: {url}")
             try:
-                time.sleep(SLEEP_BETWEEN_REQUESTS_SEC)
-                raw_lyrics = scrape_genius_lyrics(url)
-                lyrics = clean_lyrics_text(raw_lyrics, track_name)
-                print(f"Scraped {count_words(lyrics)} words.")
-            except Exception as e:
-                print(f"Error scraping: {e}")
-                lyrics = ""
-
-        print("-" * 60)
-        print(lyrics if lyrics.strip() else "(No lyrics found)")
-        print("-" * 60 + "\n")
-
-        new_row = pd.DataFrame([
-            {
-                "track_id": track_id,
-                "track_name": track_name,
-                "genius_url": url or "",
-                "lyrics": lyrics,
-                "word_count": count_words(lyrics),
-                "unique_word_count": count_unique_words(lyrics),
-                "repetition_ratio": repetition_ratio(lyrics),
-            }
-        ])
-
-        # Append row immediately to preserve progress if interrupted
-        try:
-            new_row.to_csv(
-                OUT_LYRICS,
-                mode="a",
-                header=write_header,
-                index=False,
-                encoding="utf-8",
-            )
-            write_header = False
-            print(f"Saved to {OUT_LYRICS}\n")
-        except Exception as e:
-            print(f"Failed to write row for {track_id}: {e}")
-            # continue to next track
+                for idx, fut in enumerate(as_completed(futures), 1):
+                    try:
+                        result = fut.result()
+                    except Exception as e:
+                        # Nothing is written for this track, so the next run retries it
+                        track_name = futures[fut].get("track_name") or futures[fut].get("track_id")
+                        print(f"[{idx}/{len(targets)}] Failed: {track_name}: {e}\n")
+                        continue
+
+                    track_id = result["track_id"]
+                    lyrics = result["lyrics"]
+
+                    print(f"[{idx}/{len(targets)}] Fetched: {result['track_name']}")
+                    print("-" * 60)
+                    if not result["genius_url"]:
+                        print("No Genius URL found.")
+                    else:
+                        print(f"URL: {result['genius_url']}")
+                        print(f"Scraped {result['word_count']} words.")
+
+                    print("-" * 60)
+                    print(lyrics if lyrics.strip() else "(No lyrics found)")
+                    print("-" * 60 + "\n")
+
+                    # Flush each row immediately to preserve progress if interrupted
+                    try:
+                        writer.writerow(result)
+                        out.flush()
+                        jsonl.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+                        jsonl.flush()
+                        done_file.write(f"{track_id} {os.fstat(out.fileno()).st_size}\n")
+                        done_file.flush()
+                        print(f"Saved to {OUT_LYRICS}\n")
+                    except Exception as e:
+                        print(f"Failed to write row for {track_id}: {e}")
+                        # continue to next track
+            except BaseException:
+                # Ctrl-C or a fatal error: drop the queued tracks instead of fetching
+                # them only to throw the results away
+                ex.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        out.close()
+        jsonl.close()
+        done_file.close()
 
 
 if __name__ == "__main__":
@@ -55,10 +55,12 @@ def assert_files():
 
 
 def copy_csv(cur, table: str, path: Path):
-    with open(path, "r", encoding="utf-8") as f:
+    # Raw UTF-8 bytes straight to COPY, read in 1 MB chunks (no decode/encode round trip)
+    with open(path, "rb", buffering=1 << 20) as f:
         cur.copy_expert(
-            f"COPY public.{table} FROM STDIN WITH (FORMAT csv, HEADER true)",
+            f"COPY public.{table} FROM STDIN WITH (FORMAT csv, HEADER true, ENCODING 'UTF8')",
             f,
+            size=1 << 20,
         )
 
 
@@ -69,6 +71,9 @@ def main():
     try:
         with conn:
             with conn.cursor() as cur:
+                # Bulk reload: don't wait for the WAL flush at commit (this transaction only)
+                cur.execute("SET LOCAL synchronous_commit = OFF")
+
                 # Clear existing rows
                 cur.execute("""
                     TRUNCATE TABLE